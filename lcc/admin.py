@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
 from django.utils.safestring import mark_safe
 from lcc import models
 
@@ -17,31 +19,47 @@ class LegislationAdmin(admin.ModelAdmin):
         'title', 'country__name',
         'classifications__name', 'tags__name'
     )
+    list_select_related = ('country',)
     actions = ['generate_pages']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(
+            'classifications', 'tags')
+
     def classifications_list(self, obj):
+        # Iterate over .all() so the prefetched rows are used; values_list
+        # would issue a new query for every row in the changelist.
         return '; '.join(
-            obj.classifications.values_list('name', flat=True))
+            classification.name
+            for classification in obj.classifications.all())
 
     def tags_list(self, obj):
-        return '; '.join(
-            obj.tags.values_list('name', flat=True))
+        return '; '.join(tag.name for tag in obj.tags.all())
 
     def generate_pages(self, request, queryset):
         generated = 0
         regenerated = 0
         no_pdf = 0
-        for law in queryset:
-            old_pages = law.pages.all()
-            old_pages.delete()
-
-            if not law.pdf_file:
-                no_pdf += 1
-                continue
-
-            law.save_pdf_pages()
-
-            if old_pages:
+        # Count the existing pages up front, so they can be deleted without
+        # being loaded first.
+        laws = queryset.prefetch_related(None).annotate(
+            old_pages_count=Count('pages'))
+
+        for law in laws:
+            # Replace the pages of each law in its own transaction, so a PDF
+            # failing to parse leaves the pages of that law and of the ones
+            # after it untouched.
+            with transaction.atomic():
+                models.LegislationPage.objects.filter(
+                    legislation=law).delete()
+
+                if not law.pdf_file:
+                    no_pdf += 1
+                    continue
+
+                law.save_pdf_pages()
+
+            if law.old_pages_count:
                 regenerated += 1
             else:
                 generated += 1
@@ -66,9 +84,12 @@ class UserAdmin(admin.ModelAdmin):
     list_filter = (
         "is_staff", "is_superuser", "is_active", "groups"
     )
+    list_select_related = ("userprofile",)
 
     def get_approve_url(self, obj):
-        url = obj.userprofile.approve_url
+        # Users created from the shell or createsuperuser have no profile.
+        profile = getattr(obj, 'userprofile', None)
+        url = profile.approve_url if profile else None
         link = ""
         if url:
             link = '<a href="%s">%s</a>' % (url, url)
@@ -33,6 +33,10 @@ class LegislationDocument(DocType):
 
     year_mentions = fields.ListField(fields.IntegerField())
 
+    # The year, the amendment year and the mentioned years together, so the
+    # year filter needs a single range query.
+    years = fields.ListField(fields.IntegerField())
+
     articles = fields.NestedField(properties={
         'pk': fields.IntegerField(),
         'code': fields.KeywordField(),
@@ -113,6 +117,12 @@ class LegislationDocument(DocType):
             int(year) <= settings.MAX_YEAR
         ]
 
+    def prepare_years(self, instance):
+        years = [
+            year for year in (instance.year, instance.year_amendment) if year
+        ]
+        return years + self.prepare_year_mentions(instance)
+
     def get_instances_from_related(self, related_instance):
         if isinstance(related_instance, LegislationArticle):
             return related_instance.legislation
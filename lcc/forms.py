@@ -237,6 +237,3 @@ class CustomiseCountry(CountryBase):
     """ Used on edit. """
     def others(self):
         return self._filter_on_type('checkbox', operator.ne)
-
-    def delete(self):
-        self.instance.delete()
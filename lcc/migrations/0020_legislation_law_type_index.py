@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.22 on 2026-10-14 09:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lcc', '0019_userprofile_approve_url'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='legislation',
+            name='law_type',
+            field=models.CharField(choices=[('Law', 'Law'), ('Constitution', 'Constitution'), ('Regulation', 'Regulation'), ('oth', 'Other')], db_index=True, default='Law', max_length=64),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.22 on 2026-10-14 09:40
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lcc', '0020_legislation_law_type_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessmentprofile',
+            index=models.Index(fields=['user', 'country'], name='ap_user_country_idx'),
+        ),
+    ]
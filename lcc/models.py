@@ -12,9 +12,10 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models import F, Subquery, OuterRef
-from django.db.models.signals import m2m_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.urls import reverse
 
 import lcc.utils as utils
@@ -426,10 +427,38 @@ class Country(CountryBase):
         return self.name
 
 
+# Reference data cached by the views (see lcc.views.base.cached), with the
+# models whose changes invalidate each entry.
+REFERENCE_CACHE_PREFIX = 'lcc:reference:'
+REFERENCE_CACHE_KEYS = {
+    Country: ('countries', 'country_isos'),
+    Region: ('regions',),
+    SubRegion: ('sub_regions',),
+    LegalSystem: ('legal_systems',),
+}
+
+
+def clear_reference_cache(sender, **kwargs):
+    cache.delete_many([
+        REFERENCE_CACHE_PREFIX + key for key in REFERENCE_CACHE_KEYS[sender]
+    ])
+
+
+for model in REFERENCE_CACHE_KEYS:
+    post_save.connect(clear_reference_cache, sender=model)
+    post_delete.connect(clear_reference_cache, sender=model)
+
+
 class AssessmentProfile(CountryBase):
     country = models.ForeignKey('Country', related_name='assessment_profiles')
     user = models.ForeignKey('UserProfile')
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['user', 'country'], name='ap_user_country_idx'),
+        ]
+
     def get_absolute_url(self):
         return reverse('lcc:country:view', kwargs={'iso': self.country.iso})
 
@@ -505,7 +534,8 @@ class Legislation(_TaxonomyModel):
     law_type = models.CharField(
         choices=constants.LEGISLATION_TYPE,
         default=constants.LEGISLATION_DEFAULT_VALUE,
-        max_length=64
+        max_length=64,
+        db_index=True
     )
     year = models.IntegerField(default=constants.LEGISLATION_YEAR_RANGE[-1])
     year_amendment = models.IntegerField(
@@ -586,10 +616,12 @@ class Legislation(_TaxonomyModel):
         a list of classification names with the search terms highlighted. If
         not, return the original list of classification names.
         """
-        return getattr(
-            self, '_highlighted_classifications',
-            self.classifications.all().values_list('name', flat=True)
-        )
+        if hasattr(self, '_highlighted_classifications'):
+            return self._highlighted_classifications
+        return [
+            classification.name
+            for classification in self.classifications.all()
+        ]
 
     def highlighted_tags(self):
         """
@@ -597,10 +629,9 @@ class Legislation(_TaxonomyModel):
         a list of tag names with the search terms highlighted. If not, return
         the original list of tag names.
         """
-        return getattr(
-            self, '_highlighted_tags',
-            self.tags.all().values_list('name', flat=True)
-        )
+        if hasattr(self, '_highlighted_tags'):
+            return self._highlighted_tags
+        return [tag.name for tag in self.tags.all()]
 
     def highlighted_articles(self):
         """
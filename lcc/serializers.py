@@ -35,26 +35,31 @@ class QuestionSerializer(serializers.ModelSerializer):
             serializer = QuestionAnswerSerializer(query)
             return serializer.data
 
-    def _get_children_yes(self, obj):
-        query = obj.get_children().filter(parent_answer=True)
+    def _children_by_answer(self, obj):
+        # Fetch the children once and split them by parent answer, instead of
+        # running one query for each of the three fields.
+        if not hasattr(obj, '_children_by_answer'):
+            children = {True: [], False: [], None: []}
+            for child in obj.get_children():
+                children[child.parent_answer].append(child)
+            obj._children_by_answer = children
+        return obj._children_by_answer
+
+    def _serialize_children(self, obj, parent_answer):
+        query = self._children_by_answer(obj)[parent_answer]
         if query:
             serializer = QuestionSerializer(
                 query, context=self.context, many=True)
             return serializer.data
 
+    def _get_children_yes(self, obj):
+        return self._serialize_children(obj, True)
+
     def _get_children_no(self, obj):
-        query = obj.get_children().filter(parent_answer=False)
-        if query:
-            serializer = QuestionSerializer(
-                query, context=self.context, many=True)
-            return serializer.data
+        return self._serialize_children(obj, False)
 
     def _get_children(self, obj):
-        query = obj.get_children().filter(parent_answer=None)
-        if query:
-            serializer = QuestionSerializer(
-                query, context=self.context, many=True)
-            return serializer.data
+        return self._serialize_children(obj, None)
 
 
 class SimpleClassificationSerializer(serializers.ModelSerializer):
@@ -71,15 +76,15 @@ class ClassificationSerializer(serializers.ModelSerializer):
         fields = ("id", "name",  "details", "second_level")
 
     def _get_second_level(self, obj):
+        if hasattr(obj, 'second_level_with_questions'):
+            query = obj.second_level_with_questions
+        else:
+            query = obj.get_children().filter(
+                pk__in=Question.objects.values('classification')
+            ).order_by('code')
 
-        query = obj.get_children().order_by('code')
-        new_query = query
-        for second_level in query:
-            if not Question.objects.filter(classification=second_level):
-                new_query = new_query.exclude(pk=second_level.pk)
-
-        if new_query:
-            return SimpleClassificationSerializer(new_query, many=True).data
+        if query:
+            return SimpleClassificationSerializer(query, many=True).data
 
 
 class TagsSerializer(serializers.ModelSerializer):
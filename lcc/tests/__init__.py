@@ -4,3 +4,4 @@ from .taxonomy import *
 from .legislation import *
 from .articles import *
 from .informationpages import *
+from .country import *
@@ -1,7 +1,7 @@
 from django.test import Client, TestCase
 from django.urls import reverse
 
-from lcc.models import Question
+from lcc.models import Question, TaxonomyClassification
 
 
 class QuestionTests(TestCase):
@@ -19,3 +19,102 @@ class QuestionTests(TestCase):
         c = Client()
         response = c.get(reverse('lcc:api:question_category', kwargs={"category_pk": 1}))
         self.assertEqual(response.status_code, 200)
+
+
+class QuestionTreeTests(TestCase):
+
+    def setUp(self):
+        self.category = TaxonomyClassification.objects.create(name="Category")
+        self.root = Question.objects.create(
+            text="Root", classification=self.category)
+        self.yes = Question.objects.create(
+            text="Yes", classification=self.category, parent=self.root,
+            parent_answer=True)
+        self.no = Question.objects.create(
+            text="No", classification=self.category, parent=self.root,
+            parent_answer=False)
+        self.yes_yes = Question.objects.create(
+            text="Yes, yes", classification=self.category, parent=self.yes,
+            parent_answer=True)
+        self.no_any = Question.objects.create(
+            text="No, any", classification=self.category, parent=self.no)
+
+    def question(self, question, **children):
+        data = {
+            'id': question.pk,
+            'text': question.text,
+            'order': question.order,
+            'answer': None,
+            'children_yes': None,
+            'children_no': None,
+            'children': None,
+        }
+        data.update(children)
+        return data
+
+    def test_question_tree(self):
+        c = Client()
+        url = reverse(
+            'lcc:api:question_category',
+            kwargs={"category_pk": self.category.pk}
+        )
+        # The whole tree in one query
+        with self.assertNumQueries(1):
+            response = c.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [
+            self.question(
+                self.root,
+                children_yes=[
+                    self.question(
+                        self.yes,
+                        children_yes=[self.question(self.yes_yes)]
+                    ),
+                ],
+                children_no=[
+                    self.question(
+                        self.no,
+                        children=[self.question(self.no_any)]
+                    ),
+                ],
+            ),
+        ])
+
+
+class ClassificationTests(TestCase):
+
+    def setUp(self):
+        self.top = TaxonomyClassification.objects.create(name="Top")
+        self.with_questions = TaxonomyClassification.objects.create(
+            name="With questions", parent=self.top)
+        TaxonomyClassification.objects.create(
+            name="Without questions", parent=self.top)
+        Question.objects.create(
+            text="Question", classification=self.with_questions)
+        # A top level classification whose children have no questions
+        empty = TaxonomyClassification.objects.create(name="Empty")
+        TaxonomyClassification.objects.create(
+            name="Empty child", parent=empty)
+
+    def test_classification_list_view(self):
+        c = Client()
+        # The top level classifications and their second level
+        with self.assertNumQueries(2):
+            response = c.get(reverse('lcc:api:classification'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [
+            {
+                'id': self.top.pk,
+                'name': self.top.name,
+                'details': self.top.details,
+                'second_level': [
+                    {
+                        'id': self.with_questions.pk,
+                        'name': self.with_questions.name,
+                        'details': self.with_questions.details,
+                    },
+                ],
+            },
+        ])
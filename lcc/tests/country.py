@@ -0,0 +1,166 @@
+from django.contrib.auth.models import User
+from django.forms.models import model_to_dict
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+
+from lcc.forms import CustomiseCountry
+from lcc.models import HDI_RANGES, AssessmentProfile, Country, UserProfile
+from lcc.views.country import (
+    _boolean_field_q, _range_field_q, build_filter_q
+)
+
+
+class CountryProfile(TestCase):
+    fixtures = [
+        'Countries.json',
+    ]
+
+    def setUp(self):
+        user = User.objects.create(username='policymaker')
+        user.set_password('foobar')
+        user.save()
+        self.user_profile = UserProfile.objects.create(
+            user=user, home_country_id='AFG')
+        self.client.login(username='policymaker', password='foobar')
+        self.customise_url = reverse(
+            'lcc:country:customise', kwargs={'iso': 'AFG'})
+        self.view_url = reverse('lcc:country:view', kwargs={'iso': 'AFG'})
+
+    def get_profile(self):
+        return AssessmentProfile.objects.get(
+            user=self.user_profile, country_id='AFG')
+
+    def get_form_data(self, profile, **changes):
+        data = model_to_dict(profile, fields=CustomiseCountry().fields)
+        for name, value in data.items():
+            if isinstance(value, list):
+                data[name] = [related.pk for related in value]
+            elif value is None:
+                data[name] = ''
+        data.update(changes)
+        return data
+
+    def test_customise_creates_profile(self):
+        response = self.client.get(self.customise_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_profile().population, 36373.176)
+
+    def test_save_customised_profile(self):
+        self.client.get(self.customise_url)
+        data = self.get_form_data(
+            self.get_profile(), population=1000, save='Save customisations')
+
+        response = self.client.post(self.customise_url, data)
+
+        self.assertRedirects(response, self.view_url)
+        self.assertEqual(self.get_profile().population, 1000)
+
+    def test_discard_customised_profile(self):
+        self.client.get(self.customise_url)
+
+        response = self.client.post(
+            self.customise_url, {'discard': 'Revert to original'})
+
+        self.assertRedirects(response, self.view_url)
+        self.assertFalse(
+            AssessmentProfile.objects.filter(
+                user=self.user_profile, country_id='AFG').exists()
+        )
+
+    def test_delete_customised_profile(self):
+        self.client.get(self.customise_url)
+
+        response = self.client.get(
+            reverse('lcc:country:delete', kwargs={'iso': 'AFG'}))
+
+        self.assertRedirects(response, self.view_url)
+        self.assertFalse(
+            AssessmentProfile.objects.filter(
+                user=self.user_profile, country_id='AFG').exists()
+        )
+
+    def test_delete_missing_customised_profile(self):
+        response = self.client.get(
+            reverse('lcc:country:delete', kwargs={'iso': 'AFG'}))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CountryMetadataFilters(SimpleTestCase):
+
+    def get_request(self, **params):
+        return RequestFactory().get('/legislation/', params)
+
+    def test_range_indexes_are_numbers(self):
+        request = self.get_request(**{'hdi2015': ['9', '10']})
+
+        q = _range_field_q(request, 'hdi2015')
+
+        self.assertEqual(sorted(q.children), [
+            ('hdi2015__gte', HDI_RANGES[9][0]),
+            ('hdi2015__lte', HDI_RANGES[10][1]),
+        ])
+
+    def test_range_given_bounds(self):
+        request = self.get_request(**{'hdi2015': ['1']})
+
+        q = _range_field_q(request, 'hdi2015', 0.5, 0.6)
+
+        self.assertEqual(sorted(q.children), [
+            ('hdi2015__gte', 0.5),
+            ('hdi2015__lte', 0.6),
+        ])
+
+    def test_range_missing(self):
+        self.assertFalse(_range_field_q(self.get_request(), 'hdi2015'))
+
+    def test_boolean(self):
+        for value, expected in [('true', True), ('1', True), ('False', False),
+                                ('0', False)]:
+            q = _boolean_field_q(self.get_request(un=value), 'un')
+            self.assertEqual(q.children, [('un', expected)])
+
+    def test_boolean_invalid_or_missing(self):
+        self.assertFalse(_boolean_field_q(self.get_request(un='yes'), 'un'))
+        self.assertFalse(_boolean_field_q(self.get_request(), 'un'))
+
+    def test_boolean_given_value(self):
+        q = _boolean_field_q(self.get_request(un='true'), 'un', False)
+
+        self.assertEqual(q.children, [('un', False)])
+
+    def test_build_filter_q(self):
+        request = self.get_request(**{
+            'un': 'true',
+            'region': ['Africa', 'Asia'],
+            'hdi2015': ['10', '9'],
+        })
+
+        q = build_filter_q(request)
+
+        self.assertEqual(q.connector, 'AND')
+        self.assertEqual(sorted(q.children), [
+            ('hdi2015__gte', HDI_RANGES[9][0]),
+            ('hdi2015__lte', HDI_RANGES[10][1]),
+            ('region__name__in', ['Africa', 'Asia']),
+            ('un', True),
+        ])
+
+    def test_build_filter_q_empty(self):
+        self.assertFalse(build_filter_q(self.get_request(page='2')))
+
+    def test_build_filter_q_country(self):
+        country = Country(
+            un=False, hdi2015=HDI_RANGES[3][0], population=0, gdp_capita=0,
+            ghg_no_lucf=0, ghg_lucf=0.5
+        )
+        request = self.get_request(**{'un': 'true', 'hdi2015': ['0']})
+
+        q = build_filter_q(request, country)
+
+        self.assertEqual(sorted(q.children), [
+            ('hdi2015__gte', HDI_RANGES[3][0]),
+            ('hdi2015__lte', HDI_RANGES[3][1]),
+            ('un', False),
+        ])
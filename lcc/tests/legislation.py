@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 
@@ -5,9 +6,10 @@ from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.management import call_command
 from django.test import Client, TestCase, override_settings
 from django.conf import settings
-from unittest import skip
+from unittest import mock, skip
 
-from lcc.models import Legislation
+from lcc.documents import LegislationDocument
+from lcc.models import Legislation, LegislationPage
 
 
 class LegislationExplorer(TestCase):
@@ -469,10 +471,83 @@ class LegislationExplorer(TestCase):
         self.assertEqual(len(response.context['laws']), 1)
         self.assertEqual(response.context['laws'].number, 1)
 
+    @override_settings(LAWS_PER_PAGE=2)
+    def test_pagination_out_of_range(self):
+
+        c = Client()
+
+        # Past ElasticSearch's max_result_window
+        law_types = ['Law', 'Constitution']  # Law types that return 6 results
+        response = c.get(
+            '/legislation/',
+            {'law_types[]': law_types, 'page': 9999}
+        )
+
+        # Returns last existing page
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['laws']), 2)
+        self.assertEqual(response.context['laws'].number, 3)
+
     def tearDown(self):
         shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
 
 
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class LegislationExplorerDatabase(TestCase):
+    """
+    Without any filter the laws are listed from the database, so these tests
+    don't need ElasticSearch.
+    """
+    fixtures = [
+        'Countries.json',
+        'Gaps.json',
+        'Questions.json',
+        'TaxonomyClassification.json',
+        'TaxonomyTag.json',
+        'TaxonomyTagGroup.json',
+        'Legislation.json',
+    ]
+
+    def setUp(self):
+        patcher = mock.patch.object(
+            LegislationDocument, 'search', side_effect=ConnectionError)
+        self.search = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(LAWS_PER_PAGE=20)
+    def test_unfiltered(self):
+        c = Client()
+        response = c.get('/legislation/')
+
+        self.assertEqual(response.status_code, 200)
+        self.search.assert_not_called()
+        self.assertEqual(
+            [law.id for law in response.context['laws']],
+            list(Legislation.objects.order_by('id').values_list(
+                'id', flat=True))
+        )
+
+    @override_settings(LAWS_PER_PAGE=2)
+    def test_unfiltered_page(self):
+        c = Client()
+        response = c.get('/legislation/', {'page': 2})
+
+        self.search.assert_not_called()
+        self.assertEqual(response.context['laws'].number, 2)
+        self.assertEqual(
+            [law.id for law in response.context['laws']],
+            list(Legislation.objects.order_by('id').values_list(
+                'id', flat=True)[2:4])
+        )
+
+    def test_filtered(self):
+        c = Client()
+        for params in [{'q': 'rabbits'}, {'countries[]': ['ROU']}]:
+            with self.assertRaises(ConnectionError):
+                c.get('/legislation/', params)
+        self.assertEqual(self.search.call_count, 2)
+
+
 class LegislationExplorerOrder(TestCase):
     fixtures = [
         'Countries.json',
@@ -511,3 +586,37 @@ class LegislationExplorerOrder(TestCase):
         # 69 is the id of the only one of the 3 laws in the database that
         # contains an article with the exact phrase
         # "Exercise policy coordination". It must appear at the top.
+
+
+class LegislationPages(TestCase):
+    fixtures = [
+        'Countries.json',
+    ]
+
+    def get_pages(self, law_pk):
+        response = Client().get('/legislation/{}/pages/'.format(law_pk))
+        self.assertEqual(response.status_code, 200)
+        return json.loads(
+            b''.join(response.streaming_content).decode('utf-8'))
+
+    def test_pages(self):
+        law = Legislation.objects.create(title="Law", country_id="ROU")
+        LegislationPage.objects.create(
+            legislation=law, page_number=1, page_text='<pre>First "page"</pre>')
+        LegislationPage.objects.create(
+            legislation=law, page_number=2, page_text='<pre>Second page</pre>')
+
+        self.assertEqual(self.get_pages(law.pk), {
+            '1': '<pre>First "page"</pre>',
+            '2': '<pre>Second page</pre>',
+        })
+
+    def test_no_pages(self):
+        law = Legislation.objects.create(title="Law", country_id="ROU")
+
+        self.assertEqual(self.get_pages(law.pk), {})
+
+    def test_missing_law(self):
+        response = Client().get('/legislation/0/pages/')
+
+        self.assertEqual(response.status_code, 404)
@@ -1,7 +1,10 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django_webtest import WebTest
 from lcc.models import (
-    TaxonomyTagGroup, TaxonomyTag, TaxonomyClassification
+    TaxonomyTagGroup, TaxonomyTag, TaxonomyClassification, Country
 )
+from lcc.views.base import cached
 
 
 def create_taxonomy_tag_group(name="test_tag_group"):
@@ -56,3 +59,36 @@ class TaxonomyClassificationTest(WebTest):
         self.assertEqual(top_level.code, "1")
         self.assertEqual(second_level.code, "1.1")
         self.assertEqual(third_level.code, "1.1.1")
+
+
+@override_settings(CACHES={
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+})
+class ReferenceCacheTest(TestCase):
+    fixtures = [
+        'Countries.json',
+    ]
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_cached(self):
+        self.assertEqual(cached('countries', lambda: ['AFG']), ['AFG'])
+        # Not computed again while cached
+        self.assertEqual(cached('countries', lambda: ['ROU']), ['AFG'])
+
+    def test_country_save_clears_countries(self):
+        cached('countries', lambda: ['AFG'])
+        cached('country_isos', lambda: frozenset(['AFG']))
+        country = Country.objects.get(iso='AFG')
+        country.name = 'Afghanistan, Islamic Republic of'
+        country.save()
+        self.assertIsNone(cache.get('lcc:reference:countries'))
+        self.assertIsNone(cache.get('lcc:reference:country_isos'))
+
+    def test_country_delete_clears_countries(self):
+        cached('countries', lambda: ['AFG'])
+        Country.objects.filter(iso='AFG').delete()
+        self.assertIsNone(cache.get('lcc:reference:countries'))
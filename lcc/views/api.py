@@ -1,3 +1,5 @@
+from django.db.models import Prefetch
+
 from rest_framework import generics
 
 from lcc import models, serializers
@@ -68,7 +70,14 @@ class QuestionViewSet(generics.ListAPIView):
 
     def get_queryset(self):
         category = self.kwargs['category_pk']
-        return models.Question.objects.filter(level=0, classification=category)
+        roots = models.Question.objects.filter(
+            level=0, classification=category)
+        # Load the whole question trees in one query; get_cached_trees
+        # attaches the children to every node so the serializer does not
+        # query them again.
+        return models.Question.objects.filter(
+            tree_id__in=roots.values('tree_id')
+        ).order_by('tree_id', 'lft').get_cached_trees()
 
     def get_serializer_context(self):
         assessment_pk = self.request.query_params.get('assessment_pk', None)
@@ -82,19 +91,22 @@ class ClassificationViewSet(generics.ListAPIView):
     serializer_class = serializers.ClassificationSerializer
 
     def get_queryset(self):
-        queryset = models.TaxonomyClassification.objects.filter(
-            level=0
-        ).order_by('code')
-        new_queryset = queryset
-        for top_level in queryset:
-            flag = False
-            for second_level in top_level.get_children().order_by('code'):
-                if models.Question.objects.filter(classification=second_level):
-                    flag = True
-            if not flag:
-                new_queryset = new_queryset.exclude(pk=top_level.pk)
-
-        return new_queryset
+        with_questions = models.TaxonomyClassification.objects.filter(
+            pk__in=models.Question.objects.values('classification')
+        )
+        # Only the top level classifications having at least one second level
+        # classification with questions are listed. The second level is
+        # prefetched so the serializer does not query it for every row.
+        return models.TaxonomyClassification.objects.filter(
+            level=0,
+            children__in=with_questions
+        ).distinct().order_by('code').prefetch_related(
+            Prefetch(
+                'children',
+                queryset=with_questions.order_by('code'),
+                to_attr='second_level_with_questions'
+            )
+        )
 
 
 class AnswerList(generics.ListCreateAPIView):
@@ -116,7 +128,7 @@ class AssessmentList(generics.ListCreateAPIView):
 
 
 class CountryViewSet(generics.ListAPIView):
-    queryset = models.Country.objects.all()
+    queryset = models.Country.objects.only('iso', 'name')
     serializer_class = serializers.CountrySerializer
 
 
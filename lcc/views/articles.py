@@ -5,7 +5,9 @@ from django.shortcuts import get_object_or_404
 from django.views.generic import DetailView, CreateView, UpdateView, DeleteView
 
 from lcc import models, forms
-from lcc.views.base import TagGroupRender, TaxonomyFormMixin
+from lcc.views.base import (
+    TagGroupRender, TaxonomyFormMixin, get_tag_groups
+)
 
 
 class ArticleFormMixin:
@@ -36,7 +38,7 @@ class AddArticles(mixins.LoginRequiredMixin, TaxonomyFormMixin,
                 "add_article": True,
                 "tag_groups": [
                     TagGroupRender(tag_group)
-                    for tag_group in models.TaxonomyTagGroup.objects.all()
+                    for tag_group in get_tag_groups()
                 ],
                 "classifications":
                     models.TaxonomyClassification.objects.filter(
@@ -94,7 +96,7 @@ class EditArticles(mixins.LoginRequiredMixin,
             ],
             "tag_groups": [
                 TagGroupRender(tag_group)
-                for tag_group in models.TaxonomyTagGroup.objects.all()
+                for tag_group in get_tag_groups()
             ],
             "classifications": models.TaxonomyClassification.objects.filter(
                 level=0).order_by('code')
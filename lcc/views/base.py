@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django import views
@@ -7,13 +9,40 @@ from django import views
 from lcc import models
 
 
+def cached(key, factory):
+    """ Return the reference data stored under `key`, computing it with
+    `factory` when missing. Entries are shared by all the processes through
+    the configured cache, expire after REFERENCE_CACHE_TIMEOUT seconds and
+    are deleted when their models are saved or deleted (see
+    lcc.models.REFERENCE_CACHE_KEYS). Queryset updates send no signals, so
+    their changes only show up once the entries expire.
+    """
+    return cache.get_or_set(
+        models.REFERENCE_CACHE_PREFIX + key, factory,
+        settings.REFERENCE_CACHE_TIMEOUT
+    )
+
+
+def get_countries():
+    """ All the countries, ordered by name, with only the iso code and the
+    name loaded.
+    """
+    return cached('countries', lambda: list(
+        models.Country.objects.only('iso', 'name').order_by('name')))
+
+
+def get_tag_groups():
+    """ All the tag groups, with their tags prefetched. """
+    return models.TaxonomyTagGroup.objects.prefetch_related('tags')
+
+
 class TagGroupRender():
     def __init__(self, tag_group):
         self.name = tag_group.name
         self.pk = tag_group.pk
         self.tags = [
             {'name': tag.name, 'pk': tag.pk}
-            for tag in models.TaxonomyTag.objects.filter(group=tag_group)
+            for tag in tag_group.tags.all()
         ]
 
 
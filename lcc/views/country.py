@@ -1,6 +1,5 @@
-import ast
-
 from django.db import transaction
+from django.db.models import Manager, Prefetch, Q
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
@@ -9,87 +8,141 @@ from django.views.generic import DetailView, UpdateView, DeleteView
 from lcc.models import (
     POP_RANGES, HDI_RANGES, GDP_RANGES,
     GHG_NO_LUCF, GHG_LUCF,
-    AssessmentProfile, Country,
+    AssessmentProfile, Country, FocusArea, PrioritySector,
 )
 
 import lcc.forms as forms
+from lcc.views.base import get_countries
+
+
+_BOOL_MAP = {
+    'True': True,
+    'False': False,
+    'true': True,
+    'false': False,
+    '1': True,
+    '0': False,
+}
+
+
+BOOLEAN_FIELDS = [
+    "cw",
+    "small_cw",
+    "un",
+    "ldc",
+    "lldc",
+    "sid",
+]
+
+LIST_FIELDS = [
+    "region",
+    "sub_region",
+    "legal_system",
+]
+
+RANGE_FIELDS = {
+    "population": POP_RANGES,
+    "hdi2015": HDI_RANGES,
+    "gdp_capita": GDP_RANGES,
+    "ghg_no_lucf": GHG_NO_LUCF,
+    "ghg_lucf": GHG_LUCF,
+}
+
+
+def _boolean_field_q(request, field, value=None):
+    val = request.GET.get(field)
+    if not val:
+        return Q()
+    if value is None:
+        if val not in _BOOL_MAP:
+            return Q()
+        value = _BOOL_MAP[val]
+    return Q(**{field: value})
+
+
+def _list_field_q(request, field, value=None):
+    values = request.GET.getlist(field)
+    if not values:
+        return Q()
+    field_name = "{}__name__in".format(field)
+    return Q(**{field_name: [value] if value is not None else values})
+
+
+def _range_field_q(request, field, min_value=None, max_value=None):
+    values = request.GET.getlist(field)
+    if not values:
+        return Q()
+    if not (min_value and max_value):
+        ranges = RANGE_FIELDS[field]
+        indexes = [int(value) for value in values]
+        min_value = ranges[min(indexes)][0]
+        max_value = ranges[max(indexes)][1]
+    return Q(**{
+        "{}__gte".format(field): min_value,
+        "{}__lte".format(field): max_value,
+    })
+
+
+def _range_bounds(country, field):
+    min_value = None
+    max_value = None
+    if country:
+        for range in RANGE_FIELDS[field]:
+            if range[0] <= getattr(country, field) <= range[1]:
+                min_value = range[0]
+                max_value = range[1]
+    return min_value, max_value
+
+
+def build_filter_q(request, country=None):
+    """ Build a single Q object out of the country metadata filters found in
+    the querystring. When a country is given, its own values are used instead
+    of the ones in the querystring.
+    """
+    q = Q()
+    for field in BOOLEAN_FIELDS:
+        q &= _boolean_field_q(request, field, getattr(country, field, None))
+
+    for field in LIST_FIELDS:
+        q &= _list_field_q(request, field, getattr(country, field, None))
+
+    for field in RANGE_FIELDS:
+        q &= _range_field_q(request, field, *_range_bounds(country, field))
+    return q
 
-class CountryMetadataFiltering:
 
-    BOOLEAN_FIELDS = [
-        "cw",
-        "small_cw",
-        "un",
-        "ldc",
-        "lldc",
-        "sid",
-    ]
-
-    LIST_FIELDS = [
-        "region",
-        "sub_region",
-        "legal_system",
-    ]
-
-    RANGE_FIELDS = {
-        "population": POP_RANGES,
-        "hdi2015": HDI_RANGES,
-        "gdp_capita": GDP_RANGES,
-        "ghg_no_lucf": GHG_NO_LUCF,
-        "ghg_lucf": GHG_LUCF,
-    }
-
-    def __init__(self, *args, **kwargs):
-        self.data = {}
-        self.countries = Country.objects.all()
-        return super(CountryMetadataFiltering, self).__init__(*args, **kwargs)
-
-    def filter_boolean_fields(self, request, field, value=None):
-        if request.GET.get(field):
-            if value is not None:
-                self.data[field] = value
-                return
-            self.data[field] = ast.literal_eval(request.GET.get(field))
-
-    def filter_list_fields(self, request, field, value=None):
-        if request.GET.getlist(field):
-            field_name = "{}__name__in".format(field)
-            if value is not None:
-                self.data[field_name] = [value]
-                return
-            self.data[field_name] = request.GET.getlist(field)
-
-    def filter_range_fields(self, request, field, min_value=None, max_value=None):
-        if request.GET.getlist(field):
-            min_field_name = "{}__gte".format(field)
-            max_field_name = "{}__lte".format(field)
-            if not (min_value and max_value):
-                field_values = request.GET.getlist(field)
-                min_value = self.RANGE_FIELDS[field][int(min(field_values))][0]
-                max_value = self.RANGE_FIELDS[field][int(max(field_values))][1]
-            self.data[min_field_name] = min_value
-            self.data[max_field_name] = max_value
+class CountryMetadataFiltering:
 
     def filter_countries(self, request, country=None, selected_countries=False):
-        for field in self.BOOLEAN_FIELDS:
-            self.filter_boolean_fields(request, field, getattr(country, field, None))
-
-        for field in self.LIST_FIELDS:
-            self.filter_list_fields(request, field, getattr(country, field, None))
-
-        for field, ranges in self.RANGE_FIELDS.items():
-            min_value = None
-            max_value = None
-            if country:
-                for range in ranges:
-                    if range[0] <= getattr(country, field) <= range[1]:
-                        min_value = range[0]
-                        max_value = range[1]
-                        continue
-            self.filter_range_fields(request, field, min_value, max_value)
-        if selected_countries == True and not self.data:
-            return self.countries.none()
-        return self.countries.filter(**self.data)
+        q = build_filter_q(request, country)
+        if selected_countries and not q:
+            return Country.objects.none()
+        return Country.objects.filter(q)
+
+
+def _with_metadata_relations(queryset, prefix=''):
+    """ Load the related fields rendered by Metadata along with the rows.
+    Metadata only displays the names of the many to many values.
+    """
+    return queryset.select_related(*(
+        prefix + name for name in ('region', 'sub_region', 'legal_system')
+    )).prefetch_related(
+        Prefetch(
+            prefix + 'mitigation_focus_areas',
+            queryset=FocusArea.objects.only('name')
+        ),
+        Prefetch(
+            prefix + 'adaptation_priority_sectors',
+            queryset=PrioritySector.objects.only('name')
+        ),
+    )
+
+
+def _get_country(iso):
+    return get_object_or_404(
+        _with_metadata_relations(Country.objects),
+        iso=iso
+    )
 
 
 class Metadata:
@@ -103,8 +156,13 @@ class Metadata:
         ghg_lucf_range='Total GHG Emissions including LUCF MtCO2e 2014 ranges'
     )
 
+    # The form is never bound, so a single instance is shared by all the
+    # Metadata objects; the field types are computed once from it.
+    _form = None
+    _field_types = None
+
     def __init__(self, original, customised):
-        self.form = forms.CountryBase()
+        self.form = self._get_form()
         self.original = original
         self.customised = customised
 
@@ -112,7 +170,9 @@ class Metadata:
         for name in self.form.fields:
             yield getattr(self, name)
             range = f'{name}_range'
-            if hasattr(self.original, range):
+            # Look the property up on the class so it is not evaluated once
+            # here and again when building the entry.
+            if hasattr(type(self.original), range):
                 yield getattr(self, range)
 
     @staticmethod
@@ -120,7 +180,7 @@ class Metadata:
         value = getattr(target, name)
         return (
             [v.name for v in value.all()]
-            if hasattr(value, 'all')
+            if isinstance(value, Manager)
             else value
         )
 
@@ -131,16 +191,27 @@ class Metadata:
             else self.form[name].label
         )
 
-    def _get_type(self, name):
-        field = self.form.fields.get(name, None)
-
-        if not field:
-            return None
+    @classmethod
+    def _get_form(cls):
+        if cls._form is None:
+            cls._form = forms.CountryBase()
+        return cls._form
+
+    @classmethod
+    def _get_field_types(cls):
+        if cls._field_types is None:
+            cls._field_types = {
+                name: (
+                    'multiple'
+                    if getattr(field.widget, 'allow_multiple_selected', None)
+                    else field.widget.input_type
+                )
+                for name, field in cls._get_form().fields.items()
+            }
+        return cls._field_types
 
-        if getattr(field.widget, 'allow_multiple_selected', None):
-            return 'multiple'
-
-        return field.widget.input_type
+    def _get_type(self, name):
+        return self._get_field_types().get(name)
 
     def __getattr__(self, name):
         val_orig = self._get_value(self.original, name)
@@ -150,7 +221,7 @@ class Metadata:
             else val_orig
         )
 
-        return dict(
+        result = dict(
             value=val_custom,
             orig=val_orig,
             name=name,
@@ -158,6 +229,9 @@ class Metadata:
             type=self._get_type(name),
             modified=val_custom != val_orig
         )
+        # Store the result so repeated template lookups skip __getattr__.
+        self.__dict__[name] = result
+        return result
 
     def is_customised(self):
         return self.customised is not None
@@ -169,20 +243,18 @@ class Details(DetailView):
     pk_url_kwarg = 'iso'
 
     def get_object(self):
-        iso = self.kwargs.get(self.pk_url_kwarg)
-        return get_object_or_404(
-            self.model,
-            iso=iso
-        )
+        return _get_country(self.kwargs.get(self.pk_url_kwarg))
 
     def get_context_data(self, **kwargs):
-        countries = Country.objects.all()
+        countries = get_countries()
         context = super().get_context_data(**kwargs)
         context['countries'] = countries
         context['country'] = self.object
         try:
-            metadata_user = AssessmentProfile.objects.get(
-                country__iso=self.object.iso,
+            metadata_user = _with_metadata_relations(
+                AssessmentProfile.objects
+            ).get(
+                country=self.object,
                 user=self.request.user_profile
             )
         except AssessmentProfile.DoesNotExist:
@@ -194,13 +266,14 @@ class Details(DetailView):
 
 
 def _get_user_metadata(iso, user_profile):
+    original = _get_country(iso)
     try:
-        meta = AssessmentProfile.objects.get(
-            country__iso=iso, user=user_profile
+        meta = _with_metadata_relations(AssessmentProfile.objects).get(
+            country=original, user=user_profile
         )
     except AssessmentProfile.DoesNotExist:
-        original = Country.objects.get(iso=iso)
         meta = original.clone_to_profile(user_profile)
+    meta.country = original
     return meta
 
 
@@ -219,29 +292,27 @@ class Customise(UpdateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['country'] = self.object.country
-        try:
-            metadata_user = self.model.objects.get(
-                country__iso=self.object.country.iso,
-                user=self.request.user_profile
-            )
-        except self.model.DoesNotExist:
-            metadata_user = None
-        iso = self.kwargs.get(self.pk_url_kwarg)
-        
-        origin = get_object_or_404(
-            Country,
-            iso=iso,
-        )
-        context['meta'] = Metadata(origin, metadata_user)
+        context['meta'] = Metadata(self.object.country, self.object)
         return context
 
-    @transaction.atomic
+    def post(self, request, *args, **kwargs):
+        if request.POST.get('discard'):
+            # Reverting to the original profile needs neither the profile
+            # object nor a validated form.
+            iso = self.kwargs.get(self.pk_url_kwarg)
+            self.model.objects.filter(
+                user=request.user_profile,
+                country__iso=iso
+            ).delete()
+            return HttpResponseRedirect(
+                reverse('lcc:country:view', kwargs={'iso': iso})
+            )
+        return super().post(request, *args, **kwargs)
+
     def form_valid(self, form):
         if self.request.POST.get('save'):
-            form.save()
-
-        elif self.request.POST.get('discard'):
-            form.delete()
+            with transaction.atomic():
+                form.save()
 
         return HttpResponseRedirect(self.get_success_url())
 
@@ -250,17 +321,20 @@ class DeleteCustomisedProfile(DeleteView):
     model = AssessmentProfile
     pk_url_kwarg = 'iso'
 
+    def dispatch(self, request, *args, **kwargs):
+        self.iso = kwargs.get(self.pk_url_kwarg)
+        return super().dispatch(request, *args, **kwargs)
+
     def get_success_url(self, **kwargs):
-        iso = self.kwargs.get(self.pk_url_kwarg)
         return reverse('lcc:country:view', kwargs={
-            'iso': iso
+            'iso': self.iso
         })
 
     def get_object(self):
-        iso = self.kwargs.get(self.pk_url_kwarg)
-        return AssessmentProfile.objects.get(
+        return get_object_or_404(
+            AssessmentProfile.objects.select_related('country', 'user'),
             user=self.request.user_profile,
-            country__iso=iso
+            country__iso=self.iso
         )
 
     def get(self, *args, **kwargs):
@@ -1,5 +1,6 @@
 import json
 import operator
+import re
 
 from functools import reduce
 
@@ -8,8 +9,9 @@ from django.conf import settings
 from django.contrib.auth import mixins
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q as DjQ
-from django.http import HttpResponseRedirect, JsonResponse
-from django.shortcuts import get_object_or_404
+from django.http import (
+    Http404, HttpResponseRedirect, StreamingHttpResponse
+)
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.views.generic import (
@@ -20,9 +22,12 @@ from elasticsearch_dsl import Q
 from lcc import models, constants, forms
 from lcc.constants import LEGISLATION_YEAR_RANGE
 from lcc.documents import LegislationDocument
-from lcc.views.base import TagGroupRender, TaxonomyFormMixin
+from lcc.views.base import (
+    TagGroupRender, TaxonomyFormMixin, cached, get_countries, get_tag_groups
+)
 from lcc.views.country import (
     CountryMetadataFiltering,
+    build_filter_q,
     POP_RANGES,
     HDI_RANGES,
     GDP_RANGES,
@@ -33,6 +38,47 @@ from lcc.views.country import (
 
 CONN = settings.TAXONOMY_CONNECTOR
 
+# Root document fields searched by the full-text query
+LAW_TEXT_FIELDS = ['title', 'abstract', 'pdf_text', 'classifications', 'tags']
+# Taxonomy fields highlighted on the root document
+TAXONOMY_HIGHLIGHT_FIELDS = (
+    'classifications', 'article_classifications', 'tags', 'article_tags'
+)
+
+# Highlighted names in the taxonomy fields
+_EM_RE = re.compile(r'<em>(.+?)</em>')
+
+
+def _year_range_q(from_year, to_year):
+    # `years` holds the year, the amendment year and the mentioned years of
+    # the law; a range on it matches when any of them is in the range.
+    return Q('range', years={'gte': from_year, 'lte': to_year})
+
+
+def _article_inner_hits(highlight_fields):
+    # Only the pk, the code and the highlights of the matched articles are
+    # used, so read them from doc values instead of loading the _source.
+    return {
+        '_source': False,
+        'docvalue_fields': ['articles.pk', 'articles.code'],
+        'highlight': {'fields': highlight_fields},
+    }
+
+
+def _phrase_query(field, names):
+    if not names:
+        # None of the requested taxonomy ids exist, so nothing can match.
+        return ~Q('match_all')
+    return reduce(
+        operator.or_,
+        [Q('match_phrase', **{field: name}) for name in names]
+    )
+
+
+def _taxonomy_names(model, ids):
+    names = dict(model.objects.filter(pk__in=ids).values_list('pk', 'name'))
+    return [names[pk] for pk in ids if pk in names]
+
 
 class HighlightedLaws:
     """
@@ -43,16 +89,57 @@ class HighlightedLaws:
     def __init__(self, search, sort=None):
         self.search = search
         self.sort =  sort
+        self._count = None
+        self._page = None
+
+    def fetch(self, offset, size):
+        """
+        Run the search for `size` hits starting at `offset`. The response
+        also holds the total number of hits, so fetching the requested page
+        before paginating spares the separate count request.
+        """
+        hits = self.search[offset:offset + size]
+        if self.sort:
+            hits = hits.sort(self.sort)
+        # The same filter combinations are requested over and over. ES only
+        # caches the results of searches returning hits when asked to, and
+        # sending them to the same shard copies lets them hit that cache.
+        hits = hits.params(request_cache=True, preference='_local')
+        response = hits.execute()
+        self._count = response.hits.total
+        self._page = (offset, offset + size, response)
+        return response
 
     def __getitem__(self, key):
-        hits = self.search[key]
+        if self._page and self._page[0] == key.start and (
+                self._page[1] >= key.stop):
+            response = self._page[2]
+        else:
+            response = self.fetch(key.start, key.stop - key.start)
+        hits = list(response)[:key.stop - key.start]
+        # Load all the matching laws with a single query; to_queryset() would
+        # have sent the search to ES again.
+        laws_by_id = models.Legislation.objects.prefetch_related(
+            'classifications', 'tags'
+        ).in_bulk([int(hit.meta.id) for hit in hits])
+        # Skip hits left in the index for laws no longer in the database.
+        hits_and_laws = [
+            (hit, laws_by_id[int(hit.meta.id)]) for hit in hits
+            if int(hit.meta.id) in laws_by_id
+        ]
         if self.sort:
-            return hits.sort(self.sort).to_queryset()
+            return [law for hit, law in hits_and_laws]
         laws = []
+        # Laws whose inner_hits came back empty
+        fallback_laws = []
         matched_article_tags = []
         matched_article_classifications = []
-        for hit, law in zip(hits, hits.to_queryset()):
-            if hasattr(hit.meta, 'highlight'):
+        for hit, law in hits_and_laws:
+            # to_dict() returns the raw response dict without copying it,
+            # and reading it directly skips the AttrDict/AttrList wrappers.
+            # The meta keys are probed with `in` since hasattr() raises and
+            # catches an exception for every missing key.
+            if 'highlight' in hit.meta:
                 highlights = hit.meta.highlight.to_dict()
                 if 'abstract' in highlights:
                     law._highlighted_abstract = mark_safe(
@@ -73,32 +160,26 @@ class HighlightedLaws:
                             highlights['classifications'][0].split(CONN))
                     ]
                 if 'article_classifications' in highlights:
-                    matched_article_classifications += [
-                        tag[4:-5] for tag in (
-                            highlights['article_classifications'][0].split(CONN))
-                        if '<em>' in tag
-                    ]
+                    matched_article_classifications += _EM_RE.findall(
+                        highlights['article_classifications'][0])
                 if 'tags' in highlights:
                     law._highlighted_tags = [
                         mark_safe(tag)
                         for tag in highlights['tags'][0].split(CONN)
                     ]
                 if 'article_tags' in highlights:
-                    matched_article_tags += [
-                        tag[4:-5] for tag in (
-                            highlights['article_tags'][0].split(CONN))
-                        if '<em>' in tag
-                    ]
+                    matched_article_tags += _EM_RE.findall(
+                        highlights['article_tags'][0])
 
-            if hasattr(hit.meta, 'inner_hits'):
+            if 'inner_hits' in hit.meta:
                 law._highlighted_articles = []
                 if hit.meta.inner_hits.articles:
                     for article in hit.meta.inner_hits.articles.hits:
                         article_dict = {
-                            'pk': article.pk,
-                            'code': article.code
+                            'pk': article['articles.pk'][0],
+                            'code': article['articles.code'][0]
                         }
-                        if not hasattr(article.meta, 'highlight'):
+                        if 'highlight' not in article.meta:
                             continue
                         highlights = article.meta.highlight.to_dict()
                         matched_text = highlights.get('articles.text')
@@ -125,52 +206,104 @@ class HighlightedLaws:
                                     matched_tags[0].split(CONN))
                             ]
                         law._highlighted_articles.append(article_dict)
-                elif matched_article_classifications or matched_article_tags:
-                    # NOTE: This is a hack. ElasticSearch won't return
-                    # highlighted article tags in some cases so this workaround
-                    # is necessary. Please fix if you know how. Try searching
-                    # for a keyword that is in the title of a law, and filtering
-                    # by a tag that is assigned to an article of that law, but
-                    # not the law itself. The query will work (it will only
-                    # return the law that has such an article, and not others),
-                    # but the inner_hits will be empty.
-                    law._highlighted_articles = []
-                    articles = law.articles.filter(
-                        DjQ(tags__name__in=matched_article_tags) |
-                        DjQ(
-                            classifications__name__in=(
-                                matched_article_classifications)
-                        )
-                    ).prefetch_related('tags')
-                    for article in articles:
-                        article_dict = {
-                            'pk': article.pk,
-                            'code': article.code,
-                            'classifications': [
-                                mark_safe('<em>{}</em>'.format(cl.name))
-                                if cl.name in matched_article_classifications
-                                else cl.name
-                                for cl in article.classifications.all()
-                            ],
-                            'tags': [
-                                mark_safe('<em>{}</em>'.format(tag.name))
-                                if tag.name in matched_article_tags
-                                else tag.name
-                                for tag in article.tags.all()
-                            ]
-                        }
-                        law._highlighted_articles.append(article_dict)
+                else:
+                    fallback_laws.append(law)
             laws.append(law)
+
+        if fallback_laws and (
+                matched_article_classifications or matched_article_tags):
+            # NOTE: This is a hack. ElasticSearch won't return highlighted
+            # article tags in some cases so this workaround is necessary.
+            # Please fix if you know how. Try searching for a keyword that is
+            # in the title of a law, and filtering by a tag that is assigned
+            # to an article of that law, but not the law itself. The query
+            # will work (it will only return the law that has such an
+            # article, and not others), but the inner_hits will be empty.
+            # The articles of all these laws are loaded with one query.
+            articles = models.LegislationArticle.objects.filter(
+                legislation__in=fallback_laws
+            ).filter(
+                DjQ(tags__name__in=matched_article_tags) |
+                DjQ(classifications__name__in=matched_article_classifications)
+            ).distinct().prefetch_related('tags', 'classifications')
+            for article in articles:
+                article_dict = {
+                    'pk': article.pk,
+                    'code': article.code,
+                    'classifications': [
+                        mark_safe('<em>{}</em>'.format(cl.name))
+                        if cl.name in matched_article_classifications
+                        else cl.name
+                        for cl in article.classifications.all()
+                    ],
+                    'tags': [
+                        mark_safe('<em>{}</em>'.format(tag.name))
+                        if tag.name in matched_article_tags
+                        else tag.name
+                        for tag in article.tags.all()
+                    ]
+                }
+                laws_by_id[article.legislation_id]._highlighted_articles.append(
+                    article_dict)
         return laws
 
     def count(self):
-        return self.search.count()
+        if self._count is None:
+            self._count = self.search.count()
+        return self._count
+
+
+# Default index.max_result_window: ElasticSearch rejects searches whose
+# from + size is over it.
+ES_MAX_RESULT_WINDOW = 10000
+
+
+# Querystring parameters that need the search to be run by ElasticSearch.
+SEARCH_PARAMETERS = (
+    'classifications[]', 'tags[]', 'q', 'countries[]', 'law_types[]',
+    'from_year', 'to_year', 'promulgation_sort', 'country_sort',
+)
 
 
 class LegislationExplorer(CountryMetadataFiltering, ListView):
     template_name = "legislation/explorer.html"
     model = models.Legislation
 
+    def is_filtered(self):
+        return (
+            any(self.request.GET.get(name) for name in SEARCH_PARAMETERS) or
+            bool(build_filter_q(self.request))
+        )
+
+    def paginate_laws(self, all_laws):
+        paginator = Paginator(all_laws, settings.LAWS_PER_PAGE)
+
+        page = self.request.GET.get('page', 1)
+
+        try:
+            number = int(page)
+        except (TypeError, ValueError):
+            number = 1
+        if number > 0 and isinstance(all_laws, HighlightedLaws):
+            if number * settings.LAWS_PER_PAGE > ES_MAX_RESULT_WINDOW:
+                # ElasticSearch refuses to page past max_result_window, so
+                # count the hits first and clamp the page to the last one.
+                number = min(number, paginator.num_pages)
+                page = number
+            # Get the count along with the hits of the page, in one request.
+            all_laws.fetch(
+                (number - 1) * settings.LAWS_PER_PAGE, settings.LAWS_PER_PAGE)
+
+        try:
+            laws = paginator.page(page)
+        except PageNotAnInteger:
+            # If page is not an integer, deliver first page.
+            laws = paginator.page(1)
+        except EmptyPage:
+            # If page is out of range (e.g. 9999), deliver last page of results.
+            laws = paginator.page(paginator.num_pages)
+        return laws
+
     def get_sort(self):
         promulgation_sort = self.request.GET.get("promulgation_sort")
         country_sort = self.request.GET.get("country_sort")
@@ -194,6 +327,15 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
         is lost, so we need to make things a bit more custom.
         """
 
+        if not self.is_filtered():
+            # Nothing to search, filter or sort by: ElasticSearch would only
+            # list all the laws by id, so read them from the database.
+            return self.paginate_laws(
+                models.Legislation.objects.prefetch_related(
+                    'classifications', 'tags'
+                ).order_by('id')
+            )
+
         law_queries = []
         article_queries = []
         article_highlights = {}
@@ -209,44 +351,21 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
 
         if classification_ids:
 
-            classification_names = models.TaxonomyClassification.objects.filter(
-                pk__in=classification_ids).values_list('name', flat=True)
+            classification_names = _taxonomy_names(
+                models.TaxonomyClassification, classification_ids)
 
             # Search root document for any of the classifications received
             law_queries.append(
-                reduce(
-                    operator.or_,
-                    [
-                        Q('match_phrase', classifications=name)
-                        for name in classification_names
-                    ]
-                ) | reduce(
-                    operator.or_,
-                    [
-                        Q('match_phrase', article_classifications=name)
-                        for name in classification_names
-                    ]
-                )
+                _phrase_query('classifications', classification_names) |
+                _phrase_query('article_classifications', classification_names)
             )
 
             # Search inside articles for any classifications
             article_queries.append(
-                reduce(
-                    operator.or_,
-                    [
-                        Q(
-                            'match_phrase',
-                            articles__classifications_text=name
-                        ) for name in classification_names
-                    ]
-                ) | reduce(
-                    operator.or_,
-                    [
-                        Q(
-                            'match_phrase',
-                            articles__parent_classifications=name
-                        ) for name in classification_names
-                    ]
+                _phrase_query(
+                    'articles.classifications_text', classification_names
+                ) | _phrase_query(
+                    'articles.parent_classifications', classification_names
                 )
             )
             article_highlights['articles.classifications_text'] = {
@@ -256,41 +375,18 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
         # List of strings representing TaxonomyTag ids
         tag_ids = [int(pk) for pk in self.request.GET.getlist('tags[]')]
         if tag_ids:
-            tag_names = models.TaxonomyTag.objects.filter(
-                pk__in=tag_ids).values_list('name', flat=True)
+            tag_names = _taxonomy_names(models.TaxonomyTag, tag_ids)
 
             # Search root document
             law_queries.append(
-                reduce(
-                    operator.or_,
-                    [
-                        Q('match_phrase', tags=name)
-                        for name in tag_names
-                    ]
-                ) | reduce(
-                    operator.or_,
-                    [
-                        Q('match_phrase', article_tags=name)
-                        for name in tag_names
-                    ]
-                )
+                _phrase_query('tags', tag_names) |
+                _phrase_query('article_tags', tag_names)
             )
 
             # Search inside articles
             article_queries.append(
-                reduce(
-                    operator.or_,
-                    [
-                        Q('match_phrase', articles__tags_text=name)
-                        for name in tag_names
-                    ]
-                ) | reduce(
-                    operator.or_,
-                    [
-                        Q('match_phrase', articles__parent_tags=name)
-                        for name in tag_names
-                    ]
-                )
+                _phrase_query('articles.tags_text', tag_names) |
+                _phrase_query('articles.parent_tags', tag_names)
             )
             article_highlights['articles.tags_text'] = {
                 'number_of_fragments': 0
@@ -304,12 +400,7 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
         if q:
             # Compose root document search
             law_q_query = [
-                Q(
-                    'multi_match', query=q, fields=[
-                        'title', 'abstract', 'pdf_text', 'classifications',
-                        'tags'
-                    ]
-                )
+                Q('multi_match', query=q, fields=LAW_TEXT_FIELDS)
             ]
             # Compose nested document search inside articles
             article_q_query = [
@@ -324,7 +415,10 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
             ]
             article_q_highlights = {'articles.text': {}}
 
-        search = LegislationDocument.search()
+        # Only the ids, the highlights and the inner hits of the results are
+        # used; the laws themselves are loaded from the database, so the
+        # (potentially huge) _source is not sent back.
+        search = LegislationDocument.search().source(False)
         sort = self.get_sort()
 
         if not sort:
@@ -342,9 +436,8 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
                                     article_queries
                                 )
                             ),
-                            inner_hits={
-                                'highlight': {'fields': article_highlights}
-                            }
+                            inner_hits=_article_inner_hits(
+                                article_highlights)
                         )
                     ] if article_queries else [])
                 )
@@ -361,14 +454,10 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
                                     article_queries + article_q_query
                                 )
                             ),
-                            inner_hits={
-                                'highlight': {
-                                    'fields': {
-                                        **article_highlights,
-                                        **article_q_highlights
-                                    }
-                                }
-                            }
+                            inner_hits=_article_inner_hits({
+                                **article_highlights,
+                                **article_q_highlights
+                            })
                         )
                     ] if article_queries or article_q_query else [])
                 )
@@ -393,9 +482,7 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
                             article_queries
                         )
                     ),
-                    inner_hits={
-                        'highlight': {'fields': article_highlights}
-                    }
+                    inner_hits=_article_inner_hits(article_highlights)
                 )] if article_queries else []
                 final_query = []
                 if root_query:
@@ -415,14 +502,19 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
             if countries:
                 selected_countries = True
             filtering_countries = self.filter_countries(self.request, selected_countries=selected_countries)
-            if countries or filtering_countries.count() != models.Country.objects.all().count():
-                countries.extend([country.iso for country in filtering_countries])
-                search = search.query('terms', country=countries)
+            filtering_isos = set(countries).union(
+                filtering_countries.values_list('iso', flat=True))
+            all_isos = cached('country_isos', lambda: frozenset(
+                models.Country.objects.values_list('iso', flat=True)))
+            # A filter on all the countries would not exclude any law.
+            if filtering_isos != all_isos:
+                search = search.filter(
+                    'terms', country=sorted(filtering_isos))
 
             # String representing law_type
             law_types = self.request.GET.getlist('law_types[]')
             if law_types:
-                search = search.query('terms', law_type=law_types)
+                search = search.filter('terms', law_type=law_types)
 
             # String representing the minimum year allowed in the results
             from_year = self.request.GET.get('from_year')
@@ -430,18 +522,11 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
             to_year = self.request.GET.get('to_year')
 
             if all([from_year, to_year]):
-                search = search.query(
-                    Q('range', year={'gte': int(from_year), 'lte': int(to_year)}) |
-                    Q('range', year_amendment={
-                        'gte': int(from_year), 'lte': int(to_year)}) |
-                    Q('range', year_mentions={
-                        'gte': int(from_year), 'lte': int(to_year)})
-                )
+                search = search.filter(
+                    _year_range_q(int(from_year), int(to_year)))
 
             search = search.highlight(
-                'title', 'classifications', 'article_classifications', 'tags',
-                'article_tags', number_of_fragments=0
-            )
+                'title', *TAXONOMY_HIGHLIGHT_FIELDS, number_of_fragments=0)
 
             if not any([classification_ids, tag_ids, q]):
                 # If there is no score to sort by, sort by id
@@ -449,31 +534,20 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
 
             # import json; print(json.dumps(search.to_dict(), indent=2))
 
-        all_laws = HighlightedLaws(search, sort)
-
-        paginator = Paginator(all_laws, settings.LAWS_PER_PAGE)
-
-        page = self.request.GET.get('page', 1)
-
-        try:
-            laws = paginator.page(page)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver first page.
-            laws = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range (e.g. 9999), deliver last page of results.
-            laws = paginator.page(paginator.num_pages)
-        return laws
+        return self.paginate_laws(HighlightedLaws(search, sort))
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        group_tags = models.TaxonomyTagGroup.objects.all()
+        group_tags = get_tag_groups()
         top_classifications = models.TaxonomyClassification.objects.filter(
             level=0).order_by('code')
-        countries = models.Country.objects.all().order_by('name')
-        regions = models.Region.objects.all().order_by('name')
-        sub_regions = models.SubRegion.objects.all().order_by('name')
-        legal_systems = models.LegalSystem.objects.all().order_by('name')
+        countries = get_countries()
+        regions = cached('regions', lambda: list(
+            models.Region.objects.all().order_by('name')))
+        sub_regions = cached('sub_regions', lambda: list(
+            models.SubRegion.objects.all().order_by('name')))
+        legal_systems = cached('legal_systems', lambda: list(
+            models.LegalSystem.objects.all().order_by('name')))
 
         laws = self.object_list
 
@@ -481,7 +555,10 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
             LEGISLATION_YEAR_RANGE[0],
             LEGISLATION_YEAR_RANGE[len(LEGISLATION_YEAR_RANGE) - 1]
         )
-        filters_dict = dict(self.request.GET)
+        filters_dict = {
+            name: values for name, values in self.request.GET.lists()
+            if name not in ('from_year', 'to_year')
+        }
         context.update({
             'laws': laws,
             'group_tags': group_tags,
@@ -499,8 +576,8 @@ class LegislationExplorer(CountryMetadataFiltering, ListView):
             'legislation_year': legislation_year,
             'min_year': settings.MIN_YEAR,
             'max_year': settings.MAX_YEAR,
-            'from_year': filters_dict.pop('from_year', [settings.MIN_YEAR])[0],
-            'to_year': filters_dict.pop('to_year', [settings.MAX_YEAR])[0],
+            'from_year': self.request.GET.get('from_year', settings.MIN_YEAR),
+            'to_year': self.request.GET.get('to_year', settings.MAX_YEAR),
             'filters': json.dumps(filters_dict)
         })
         return context
@@ -513,13 +590,13 @@ class LegislationAdd(mixins.LoginRequiredMixin, TaxonomyFormMixin,
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        countries = sorted(models.Country.objects.all(), key=lambda c: c.name)
+        countries = get_countries()
         context.update({
             "countries": countries,
             "legislation_type": constants.LEGISLATION_TYPE,
             "tag_groups": [
                 TagGroupRender(tag_group)
-                for tag_group in models.TaxonomyTagGroup.objects.all()
+                for tag_group in get_tag_groups()
             ],
             "available_languages": constants.ALL_LANGUAGES,
             "source_types": constants.SOURCE_TYPE,
@@ -553,14 +630,27 @@ class LegislationView(DetailView):
 class LegislationPagesView(views.View):
 
     def get(self, request, *args, **kwargs):
-        law = get_object_or_404(models.Legislation,
-                                pk=kwargs['legislation_pk'])
-        pages = law.pages.all()
-        content = {}
-        for page in pages:
-            content[page.page_number] = page.page_text
+        legislation_pk = kwargs['legislation_pk']
+        if not models.Legislation.objects.filter(pk=legislation_pk).exists():
+            raise Http404
+        pages = models.LegislationPage.objects.filter(
+            legislation_id=legislation_pk
+        ).values_list('page_number', 'page_text')
+
+        def stream():
+            # Send the pages as they are read from a server-side cursor
+            # instead of building the whole JSON document in memory.
+            separator = '{'
+            for page_number, page_text in pages.iterator():
+                yield '{}{}: {}'.format(
+                    separator, json.dumps(str(page_number)),
+                    json.dumps(page_text)
+                )
+                separator = ', '
+            yield '{}' if separator == '{' else '}'
 
-        return JsonResponse(content)
+        return StreamingHttpResponse(
+            stream(), content_type='application/json')
 
 
 class LegislationEditView(mixins.LoginRequiredMixin, TaxonomyFormMixin,
@@ -573,14 +663,14 @@ class LegislationEditView(mixins.LoginRequiredMixin, TaxonomyFormMixin,
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        countries = sorted(models.Country.objects.all(), key=lambda c: c.name)
+        countries = get_countries()
         context.update({
             "countries": countries,
             "available_languages": constants.ALL_LANGUAGES,
             "legislation_type": constants.LEGISLATION_TYPE,
             "tag_groups": [
                 TagGroupRender(tag_group)
-                for tag_group in models.TaxonomyTagGroup.objects.all()
+                for tag_group in get_tag_groups()
             ],
             "classifications": models.TaxonomyClassification.objects.filter(
                 level=0).order_by('code'),
@@ -119,6 +119,20 @@ LAWS_PER_PAGE = 10
 # Used to concatenate classification and tag names in ES indexes
 TAXONOMY_CONNECTOR = '; '
 
+# Shared by the gunicorn workers, so that clearing an entry when its models
+# change clears it everywhere. Create the table with `createcachetable`.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'lcc_cache',
+    }
+}
+
+# Number of seconds the country, region and legal system lists used by the
+# views are cached for. Saving or deleting one of these models clears its
+# lists right away.
+REFERENCE_CACHE_TIMEOUT = 300
+
 MIN_YEAR = 1945
 
 MAX_YEAR = datetime.now().year
@@ -29,5 +29,12 @@ INSTALLED_APPS += [
     'django_webtest'
 ]
 
+# Cached reference data would outlive the rollback of each test.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
+
 
 MEDIA_ROOT = MEDIA_ROOT + '/tests/'